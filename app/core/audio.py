@@ -1,9 +1,9 @@
 from __future__ import annotations
 
-import queue
 import threading
+from collections import deque
 from dataclasses import dataclass
-from typing import Optional
+from typing import Deque, Optional
 
 try:
     import pyttsx3  # type: ignore
@@ -15,49 +15,79 @@ except ImportError:  # pragma: no cover - graceful fallback if dependency missin
 class SpeechTask:
     utterance: str
     wait: bool = False
+    done: Optional[threading.Event] = None
 
 
 class TextToSpeech:
-    """Thin wrapper around pyttsx3 with thread-safe queue."""
+    """Thin wrapper around pyttsx3 with a deque and wake-up event; the worker pops without locking."""
 
     def __init__(self) -> None:
         self._engine = pyttsx3.init() if pyttsx3 is not None else None
-        self._queue: "queue.Queue[SpeechTask]" = queue.Queue()
+        self._queue: Deque[SpeechTask] = deque()
+        self._wake = threading.Event()
         self._thread: Optional[threading.Thread] = None
         self._stop_event = threading.Event()
+        # Serializes enqueueing with shutdown so no task is appended after the final drain.
+        self._enqueue_lock = threading.Lock()
         if self._engine is not None:
             self._thread = threading.Thread(target=self._run, daemon=True)
             self._thread.start()
 
-    def speak(self, utterance: str, wait: bool = False) -> None:
+    def speak(self, utterance: str, wait: bool = False, replace_pending: bool = False) -> None:
+        """Queue ``utterance``; ``replace_pending`` drops queued utterances not yet started."""
         if not utterance:
             return
         if self._engine is None:
             # Fallback: simply print to console for environments without audio support.
             print(f"[TTS模拟] {utterance}")
             return
-        self._queue.put(SpeechTask(utterance=utterance, wait=wait))
+        task = SpeechTask(utterance=utterance, wait=wait)
+        if wait:
+            task.done = threading.Event()
+        with self._enqueue_lock:
+            if self._stop_event.is_set():
+                return
+            if replace_pending:
+                self._drop_pending()
+            self._queue.append(task)
+        self._wake.set()
+        if task.done is not None:
+            task.done.wait()
 
     def shutdown(self) -> None:
         if self._engine is None:
             return
-        self._stop_event.set()
-        self._queue.put(SpeechTask("", wait=False))
+        with self._enqueue_lock:
+            self._stop_event.set()
+        self._wake.set()
         if self._thread and self._thread.is_alive():
             self._thread.join(timeout=1)
+        self._drop_pending()
         self._engine.stop()
 
+    def _drop_pending(self) -> None:
+        # popleft races safely with the worker: each task is either played or dropped.
+        # Release callers still blocked on speak(wait=True) for dropped tasks.
+        while self._queue:
+            try:
+                task = self._queue.popleft()
+            except IndexError:
+                break
+            if task.done is not None:
+                task.done.set()
+
     def _run(self) -> None:
         assert self._engine is not None
         while not self._stop_event.is_set():
-            try:
-                task = self._queue.get(timeout=0.5)
-            except queue.Empty:
-                continue
-            if not task.utterance:
-                continue
-            self._engine.say(task.utterance)
-            self._engine.runAndWait()
-            self._queue.task_done()
-            if task.wait:
-                self._queue.join()
+            self._wake.wait(timeout=0.5)
+            self._wake.clear()
+            while self._queue and not self._stop_event.is_set():
+                try:
+                    task = self._queue.popleft()
+                except IndexError:
+                    # Emptied by speak(replace_pending=True) after the check.
+                    break
+                self._engine.say(task.utterance)
+                self._engine.runAndWait()
+                if task.done is not None:
+                    task.done.set()
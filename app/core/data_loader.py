@@ -3,13 +3,14 @@ from __future__ import annotations
 import json
 import random
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 DATA_DIR = Path(__file__).resolve().parent.parent / "data"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class WordEntry:
     word: str
     phonetic: str
@@ -38,8 +39,8 @@ def _load_json_file(path: Path) -> list:
         raise DataLoaderError(f"无法解析数据文件 {path}: {exc}") from exc
 
 
-def load_words(level: str) -> List[WordEntry]:
-    level = level.lower()
+@lru_cache(maxsize=None)
+def _cached_load_words(level: str) -> Tuple[WordEntry, ...]:
     filename = {
         "cet4": "cet4_words.json",
         "cet6": "cet6_words.json",
@@ -64,10 +65,11 @@ def load_words(level: str) -> List[WordEntry]:
             raise DataLoaderError(f"词汇数据缺失字段: {exc}") from exc
     if not result:
         raise DataLoaderError(f"{level.upper()} 词汇数据为空")
-    return result
+    return tuple(result)
 
 
-def load_essays(level: Optional[str] = None) -> List[Essay]:
+@lru_cache(maxsize=None)
+def _cached_load_essays(level: Optional[str]) -> Tuple[Essay, ...]:
     raw_items = _load_json_file(DATA_DIR / "essays.json")
     essays: List[Essay] = []
     for item in raw_items:
@@ -79,18 +81,31 @@ def load_essays(level: Optional[str] = None) -> List[Essay]:
             )
         )
     if level:
-        level = level.lower()
         essays = [essay for essay in essays if essay.level.lower() == level]
     if not essays:
         raise DataLoaderError("作文数据为空")
-    return essays
+    return tuple(essays)
+
+
+def load_words(level: str) -> Tuple[WordEntry, ...]:
+    """Return the cached, immutable word list for ``level``."""
+    return _cached_load_words(level.lower())
+
+
+def load_essays(level: Optional[str] = None) -> Tuple[Essay, ...]:
+    """Return the cached, immutable essay list, optionally filtered by ``level``."""
+    return _cached_load_essays(level.lower() if level else None)
+
+
+def reload_data() -> None:
+    """Drop cached data sets so the next load re-reads the JSON files."""
+    _cached_load_words.cache_clear()
+    _cached_load_essays.cache_clear()
 
 
 def sample_word(level: str) -> WordEntry:
-    words = load_words(level)
-    return random.choice(words)
+    return random.choice(load_words(level))
 
 
 def sample_essay(level: Optional[str] = None) -> Essay:
-    essays = load_essays(level)
-    return random.choice(essays)
+    return random.choice(load_essays(level))
@@ -1,6 +1,37 @@
 from __future__ import annotations
 
 import socket
+import struct
+import sys
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not available on Windows
+    fcntl = None  # type: ignore[assignment]
+
+SIOCGIFADDR = 0x8915
+UDP_RCVBUF_SIZE = 4 * 1024 * 1024
+UDP_SNDBUF_SIZE = 1 * 1024 * 1024
+
+
+def _interface_ip() -> str | None:
+    """Read interface addresses via ioctl on Linux, avoiding any DNS lookup."""
+    if fcntl is None or not sys.platform.startswith("linux"):
+        return None
+    try:
+        interfaces = socket.if_nameindex()
+    except OSError:
+        return None
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+        for _index, name in interfaces:
+            try:
+                request = struct.pack("256s", name.encode("utf-8")[:15])
+                addr = socket.inet_ntoa(fcntl.ioctl(sock.fileno(), SIOCGIFADDR, request)[20:24])
+            except OSError:
+                continue
+            if not addr.startswith("127."):
+                return addr
+    return None
 
 
 def get_local_ip() -> str:
@@ -14,9 +45,13 @@ def get_local_ip() -> str:
     except OSError:
         pass
 
+    ip = _interface_ip()
+    if ip:
+        return ip
+
     try:
         hostname = socket.gethostname()
-        for info in socket.getaddrinfo(hostname, None):
+        for info in socket.getaddrinfo(hostname, None, socket.AF_INET, socket.SOCK_DGRAM):
             addr = info[4][0]
             if addr and not addr.startswith("127."):
                 return addr
@@ -24,3 +59,20 @@ def get_local_ip() -> str:
         pass
 
     return "127.0.0.1"
+
+
+def tune_udp_buffers(
+    sock: socket.socket,
+    rcvbuf: int = UDP_RCVBUF_SIZE,
+    sndbuf: int = UDP_SNDBUF_SIZE,
+) -> None:
+    """Enlarge the socket buffers so bursts of datagrams are not dropped.
+
+    The kernel may clamp the requested sizes (e.g. macOS without sysctl tuning);
+    a refused size simply leaves the OS default in place.
+    """
+    for option, size in ((socket.SO_RCVBUF, rcvbuf), (socket.SO_SNDBUF, sndbuf)):
+        try:
+            sock.setsockopt(socket.SOL_SOCKET, option, size)
+        except OSError:
+            pass
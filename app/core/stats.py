@@ -10,13 +10,13 @@ class PracticeStats:
     correct_letters: int = 0
     total_letters: int = 0
     correct_words: int = 0
-    start_time: float = field(default_factory=time.monotonic)
+    start_time: float = field(default_factory=time.perf_counter)
 
     def reset(self) -> None:
         self.correct_letters = 0
         self.total_letters = 0
         self.correct_words = 0
-        self.start_time = time.monotonic()
+        self.start_time = time.perf_counter()
 
     def register_word(self, word_length: int) -> None:
         self.correct_words += 1
@@ -34,7 +34,7 @@ class PracticeStats:
 
     @property
     def elapsed_minutes(self) -> float:
-        return max((time.monotonic() - self.start_time) / 60.0, 1e-6)
+        return max((time.perf_counter() - self.start_time) / 60.0, 1e-6)
 
     @property
     def words_per_minute(self) -> float:
@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+from itertools import groupby
+from operator import eq
+from typing import List, Tuple
+
+MatchRun = Tuple[int, int, bool]
+
+
+def common_prefix_length(first: str, second: str) -> int:
+    limit = min(len(first), len(second))
+    if first[:limit] == second[:limit]:
+        return limit
+    return next(idx for idx, (a, b) in enumerate(zip(first, second)) if a != b)
+
+
+def count_matches(typed: str, target: str) -> int:
+    """Number of positions where ``typed`` agrees with ``target``."""
+    if target.startswith(typed):
+        # Common case while typing correctly: a single C-level compare.
+        return len(typed)
+    return sum(map(eq, typed, target))
+
+
+def match_runs(typed: str, target: str, start: int = 0) -> List[MatchRun]:
+    """Split ``typed[start:]`` into ``(start, end, matched)`` runs against ``target``.
+
+    Characters typed past the end of ``target`` form a trailing mismatched run.
+    """
+    if start >= len(typed):
+        return []
+    if target.startswith(typed[start:], start):
+        return [(start, len(typed), True)]
+    runs: List[MatchRun] = []
+    position = start
+    for matched, run in groupby(map(eq, typed[start:], target[start:])):
+        run_end = position + sum(1 for _ in run)
+        runs.append((position, run_end, matched))
+        position = run_end
+    if position < len(typed):
+        runs.append((position, len(typed), False))
+    return runs
@@ -0,0 +1,21 @@
+from __future__ import annotations
+
+import json
+
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - fall back to the stdlib codec
+    orjson = None
+
+
+def encode(payload: dict) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def decode(data: bytes) -> object:
+    """Decode a datagram; raises ValueError on malformed JSON or UTF-8."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
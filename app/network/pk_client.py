@@ -1,10 +1,11 @@
 from __future__ import annotations
 
-import json
 import socket
 import threading
 from typing import Callable, Tuple
 
+from app.core.network_utils import tune_udp_buffers
+from app.network.codec import decode, encode
 from app.network.pk_server import PK_PORT
 
 MessageHandler = Callable[[dict], None]
@@ -14,6 +15,7 @@ class PkClient:
     def __init__(self, on_message: MessageHandler, server_addr: Tuple[str, int] = ("127.0.0.1", PK_PORT)) -> None:
         self.server_addr = server_addr
         self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        tune_udp_buffers(self.sock)
         self.sock.bind(("0.0.0.0", 0))
         self.on_message = on_message
         self.running = threading.Event()
@@ -30,10 +32,11 @@ class PkClient:
             except OSError:
                 break
             try:
-                payload = json.loads(data.decode("utf-8"))
-            except json.JSONDecodeError:
+                payload = decode(data)
+            except ValueError:
                 continue
-            self.on_message(payload)
+            if isinstance(payload, dict):
+                self.on_message(payload)
 
     def close(self) -> None:
         self.running.clear()
@@ -102,5 +105,4 @@ class PkClient:
         self._send(payload)
 
     def _send(self, payload: dict) -> None:
-        raw = json.dumps(payload).encode("utf-8")
-        self.sock.sendto(raw, self.server_addr)
+        self.sock.sendto(encode(payload), self.server_addr)
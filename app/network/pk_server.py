@@ -1,16 +1,27 @@
 from __future__ import annotations
 
-import json
 import random
 import socket
 import threading
 import time
 from dataclasses import dataclass, field
-from typing import Dict, Tuple
+from typing import Callable, Dict, Hashable, Tuple
 
 from app.core.data_loader import load_essays
+from app.core.network_utils import tune_udp_buffers
+from app.network.codec import decode, encode
 
 PK_PORT = 8270
+# Upper bound of datagrams handled before the outbox is flushed.
+MAX_BATCH = 43
+_MSG_DONTWAIT = getattr(socket, "MSG_DONTWAIT", 0)
+
+
+def _to_float(value: object, default: float = 0.0) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return default
 
 
 @dataclass
@@ -19,6 +30,11 @@ class ClientInfo:
     name: str
     addr: Tuple[str, int]
     last_seen: float = field(default_factory=time.time)
+    summary: dict = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        # Public view sent to other players; built once instead of per message.
+        self.summary = {"student_id": self.student_id, "name": self.name, "ip": self.addr[0]}
 
 
 @dataclass
@@ -35,12 +51,26 @@ class PkServer(threading.Thread):
         self.host = host
         self.port = port
         self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        tune_udp_buffers(self.sock)
         self.sock.bind((self.host, self.port))
         self.clients: Dict[str, ClientInfo] = {}
         self.challenges: Dict[str, ChallengeInfo] = {}
         self.running = threading.Event()
         self.running.set()
         self.essays = load_essays()
+        self._user_list_raw = encode({"type": "user_list", "users": []})
+        # Pending datagrams keyed by (addr, coalesce key); a newer progress update
+        # for the same player replaces the stale one before it hits the wire.
+        self._outbox: Dict[Tuple[Tuple[str, int], Hashable], bytes] = {}
+        self._outbox_seq = 0
+        self._handlers: Dict[str, Callable[[dict, Tuple[str, int]], None]] = {
+            "register": self._handle_register,
+            "deregister": self._handle_deregister,
+            "challenge_request": self._handle_challenge_request,
+            "challenge_response": self._handle_challenge_response,
+            "progress": self._handle_progress,
+            "result": self._handle_result,
+        }
 
     def run(self) -> None:
         while self.running.is_set():
@@ -48,33 +78,60 @@ class PkServer(threading.Thread):
                 data, addr = self.sock.recvfrom(16384)
             except OSError:
                 break
+            self._dispatch(data, addr)
+            if _MSG_DONTWAIT:
+                self._drain_ready()
+            self._flush()
+
+    def _drain_ready(self) -> None:
+        for _ in range(MAX_BATCH - 1):
             try:
-                payload = json.loads(data.decode("utf-8"))
-            except json.JSONDecodeError:
-                continue
+                data, addr = self.sock.recvfrom(16384, _MSG_DONTWAIT)
+            except OSError:
+                # BlockingIOError: nothing else is waiting in the receive queue.
+                return
+            self._dispatch(data, addr)
+
+    def _dispatch(self, data: bytes, addr: Tuple[str, int]) -> None:
+        try:
+            payload = decode(data)
+        except ValueError:
+            return
+        if isinstance(payload, dict):
             self._handle_message(payload, addr)
 
+    def _enqueue(self, raw: bytes, addr: Tuple[str, int], coalesce_key: Hashable = None) -> None:
+        if coalesce_key is None:
+            self._outbox_seq += 1
+            coalesce_key = self._outbox_seq
+        key = (addr, coalesce_key)
+        # Re-insert so the replacement keeps its place after earlier messages.
+        self._outbox.pop(key, None)
+        self._outbox[key] = raw
+
+    def _flush(self) -> None:
+        outbox = self._outbox
+        if not outbox:
+            return
+        self._outbox = {}
+        for (addr, _key), raw in outbox.items():
+            try:
+                self.sock.sendto(raw, addr)
+            except OSError:
+                if not self.running.is_set():
+                    return
+
     def stop(self) -> None:
         self.running.clear()
         self.sock.close()
 
     def _handle_message(self, message: dict, addr: Tuple[str, int]) -> None:
         msg_type = message.get("type")
-        if msg_type == "register":
-            self._handle_register(message, addr)
-        elif msg_type == "deregister":
-            student_id = message.get("student_id")
-            if student_id and student_id in self.clients:
-                self.clients.pop(student_id)
-                self._broadcast_user_list()
-        elif msg_type == "challenge_request":
-            self._handle_challenge_request(message)
-        elif msg_type == "challenge_response":
-            self._handle_challenge_response(message)
-        elif msg_type == "progress":
-            self._handle_progress(message)
-        elif msg_type == "result":
-            self._handle_result(message)
+        if not isinstance(msg_type, str):
+            return
+        handler = self._handlers.get(msg_type)
+        if handler is not None:
+            handler(message, addr)
 
     def _handle_register(self, message: dict, addr: Tuple[str, int]) -> None:
         student_id = str(message.get("student_id", "")).strip()
@@ -83,22 +140,27 @@ class PkServer(threading.Thread):
             return
         info = ClientInfo(student_id=student_id, name=name, addr=addr)
         self.clients[student_id] = info
+        self._rebuild_user_list()
         self._broadcast_user_list()
 
+    def _handle_deregister(self, message: dict, _addr: Tuple[str, int]) -> None:
+        student_id = message.get("student_id")
+        if student_id and student_id in self.clients:
+            self.clients.pop(student_id)
+            self._rebuild_user_list()
+            self._broadcast_user_list()
+
+    def _rebuild_user_list(self) -> None:
+        # Serialized once per membership change and reused for every broadcast.
+        user_list = [client.summary for client in self.clients.values()]
+        self._user_list_raw = encode({"type": "user_list", "users": user_list})
+
     def _broadcast_user_list(self) -> None:
-        user_list = [
-            {
-                "student_id": client.student_id,
-                "name": client.name,
-                "ip": client.addr[0],
-            }
-            for client in self.clients.values()
-        ]
-        payload = json.dumps({"type": "user_list", "users": user_list}).encode("utf-8")
+        payload = self._user_list_raw
         for client in self.clients.values():
-            self.sock.sendto(payload, client.addr)
+            self._enqueue(payload, client.addr, "user_list")
 
-    def _handle_challenge_request(self, message: dict) -> None:
+    def _handle_challenge_request(self, message: dict, _addr: Tuple[str, int]) -> None:
         target_id = message.get("target_id")
         if target_id not in self.clients:
             return
@@ -109,15 +171,11 @@ class PkServer(threading.Thread):
             return
         payload = {
             "type": "challenge_request",
-            "from": {
-                "student_id": challenger.student_id,
-                "name": challenger.name,
-                "ip": challenger.addr[0],
-            },
+            "from": challenger.summary,
         }
-        self.sock.sendto(json.dumps(payload).encode("utf-8"), opponent.addr)
+        self._enqueue(encode(payload), opponent.addr)
 
-    def _handle_challenge_response(self, message: dict) -> None:
+    def _handle_challenge_response(self, message: dict, _addr: Tuple[str, int]) -> None:
         accepted = bool(message.get("accepted"))
         challenger_id = message.get("challenger_id")
         responder_id = message.get("student_id")
@@ -130,13 +188,9 @@ class PkServer(threading.Thread):
         response_payload = {
             "type": "challenge_response",
             "accepted": accepted,
-            "from": {
-                "student_id": responder.student_id,
-                "name": responder.name,
-                "ip": responder.addr[0],
-            },
+            "from": responder.summary,
         }
-        self.sock.sendto(json.dumps(response_payload).encode("utf-8"), challenger.addr)
+        self._enqueue(encode(response_payload), challenger.addr)
 
         if accepted:
             essay = random.choice(self.essays)
@@ -154,24 +208,13 @@ class PkServer(threading.Thread):
                 "type": "start_challenge",
                 "challenge_id": challenge_id,
                 "essay": challenge_info.essay,
-                "participants": [
-                    {
-                        "student_id": challenger.student_id,
-                        "name": challenger.name,
-                        "ip": challenger.addr[0],
-                    },
-                    {
-                        "student_id": responder.student_id,
-                        "name": responder.name,
-                        "ip": responder.addr[0],
-                    },
-                ],
+                "participants": [challenger.summary, responder.summary],
             }
-            raw = json.dumps(start_payload).encode("utf-8")
-            self.sock.sendto(raw, challenger.addr)
-            self.sock.sendto(raw, responder.addr)
+            raw = encode(start_payload)
+            self._enqueue(raw, challenger.addr)
+            self._enqueue(raw, responder.addr)
 
-    def _handle_progress(self, message: dict) -> None:
+    def _handle_progress(self, message: dict, _addr: Tuple[str, int]) -> None:
         challenge_id = message.get("challenge_id")
         student_id = message.get("student_id")
         if not challenge_id or not student_id:
@@ -184,12 +227,6 @@ class PkServer(threading.Thread):
             challenge.opponent.student_id,
         ):
             return
-        def _to_float(value: object, default: float = 0.0) -> float:
-            try:
-                return float(value)
-            except (TypeError, ValueError):
-                return default
-
         progress_value = _to_float(message.get("progress", 0.0))
         progress_value = max(0.0, min(progress_value, 1.0))
         payload = {
@@ -200,19 +237,20 @@ class PkServer(threading.Thread):
             "speed": _to_float(message.get("speed", 0.0)),
             "progress": progress_value,
         }
-        raw = json.dumps(payload).encode("utf-8")
-        self.sock.sendto(raw, challenge.challenger.addr)
-        self.sock.sendto(raw, challenge.opponent.addr)
+        raw = encode(payload)
+        coalesce_key = ("progress", challenge_id, student_id)
+        self._enqueue(raw, challenge.challenger.addr, coalesce_key)
+        self._enqueue(raw, challenge.opponent.addr, coalesce_key)
 
-    def _handle_result(self, message: dict) -> None:
+    def _handle_result(self, message: dict, _addr: Tuple[str, int]) -> None:
         challenge_id = message.get("challenge_id")
         student_id = message.get("student_id")
         if challenge_id not in self.challenges or student_id not in self.clients:
             return
         challenge = self.challenges[challenge_id]
         challenge.results[student_id] = {
-            "accuracy": float(message.get("accuracy", 0.0)),
-            "speed": float(message.get("speed", 0.0)),
+            "accuracy": _to_float(message.get("accuracy", 0.0)),
+            "speed": _to_float(message.get("speed", 0.0)),
         }
         if len(challenge.results) < 2:
             return
@@ -232,9 +270,9 @@ class PkServer(threading.Thread):
             "winner": winner_id,
             "results": challenge.results,
         }
-        raw = json.dumps(payload).encode("utf-8")
-        self.sock.sendto(raw, challenge.challenger.addr)
-        self.sock.sendto(raw, challenge.opponent.addr)
+        raw = encode(payload)
+        self._enqueue(raw, challenge.challenger.addr)
+        self._enqueue(raw, challenge.opponent.addr)
 
     @staticmethod
     def _select_winner(challenger_stats: dict, opponent_stats: dict, challenge: ChallengeInfo) -> str | None:
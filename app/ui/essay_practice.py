@@ -1,12 +1,12 @@
 from __future__ import annotations
 
 import random
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from html import escape
-from typing import List, Optional
+from typing import List, Optional, Sequence, Set, Tuple
 
-from PyQt5.QtCore import Qt, QTimer, pyqtSignal
-from PyQt5.QtGui import QColor, QFontMetrics, QTextCharFormat, QTextCursor, QTextOption
+from PyQt5.QtCore import QObject, QRunnable, Qt, QThreadPool, QTimer, pyqtSignal
+from PyQt5.QtGui import QColor, QFont, QFontMetrics, QTextCharFormat, QTextCursor, QTextOption
 from PyQt5.QtWidgets import (
     QFrame,
     QHBoxLayout,
@@ -21,17 +21,42 @@ from PyQt5.QtWidgets import (
     QTextEdit,
 )
 
-from app.core.data_loader import Essay, load_essays
+from app.core.data_loader import DataLoaderError, Essay, load_essays
 from app.core.stats import EssayStats
+from app.core.text_compare import common_prefix_length, count_matches, match_runs
+
+WORDS_PER_LINE = 12
+STATUS_REFRESH_MS = 100
+LABEL_REFRESH_MS = 30
+
+CORRECT_SPAN = '<span style="color: #16a34a;">'
+INCORRECT_SPAN = '<span style="color: #dc2626;">'
+PENDING_SPAN = '<span style="color: #1e293b;">'
+SPAN_END = "</span>"
+_RUN_PREFIXES = {True: CORRECT_SPAN, False: INCORRECT_SPAN}
 
 
 class EssayInputField(QTextEdit):
     textEdited = pyqtSignal(str)
     returnPressed = pyqtSignal()
 
-    def __init__(self, target_text: str, parent: Optional[QWidget] = None) -> None:
+    _formats: Optional[Tuple[QTextCharFormat, QTextCharFormat]] = None
+
+    @classmethod
+    def _char_formats(cls) -> Tuple[QTextCharFormat, QTextCharFormat]:
+        # Shared by every line; created lazily once a QApplication exists.
+        if cls._formats is None:
+            correct_format = QTextCharFormat()
+            correct_format.setForeground(QColor("#16a34a"))
+            incorrect_format = QTextCharFormat()
+            incorrect_format.setForeground(QColor("#dc2626"))
+            cls._formats = (correct_format, incorrect_format)
+        return cls._formats
+
+    def __init__(self, target_text: str, line_index: int = 0, parent: Optional[QWidget] = None) -> None:
         super().__init__(parent)
         self.target_text = target_text
+        self.line_index = line_index
         self._raw_text = ""
         self._updating = False
 
@@ -42,6 +67,8 @@ class EssayInputField(QTextEdit):
         self.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
         self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
         self.setTabChangesFocus(True)
+        # Recolouring edits the document in place; keep it out of the undo stack.
+        self.setUndoRedoEnabled(False)
 
         self.textChanged.connect(self._handle_text_changed)
         self._apply_coloring("")
@@ -50,6 +77,10 @@ class EssayInputField(QTextEdit):
     def text(self) -> str:
         return self._raw_text
 
+    def reset(self, target_text: str) -> None:
+        self.target_text = target_text
+        self._apply_coloring("")
+
     def refresh_display(self) -> None:
         self._apply_coloring(self._raw_text)
 
@@ -75,64 +106,96 @@ class EssayInputField(QTextEdit):
         if self._updating:
             return
         plain = self.toPlainText()
+        if plain == self._raw_text:
+            # Format-only or no-op edits (e.g. IME composition) change nothing.
+            return
         if "\n" in plain:
-            plain = plain.replace("\n", "")
-        self._apply_coloring(plain)
+            self._apply_coloring(plain)
+        else:
+            # The document already holds the typed text; only recolour from the
+            # first character that differs from the previous snapshot.
+            self._apply_coloring(plain, start=common_prefix_length(self._raw_text, plain), rewrite=False)
         self.textEdited.emit(self._raw_text)
 
-    def _apply_coloring(self, content: str) -> None:
+    def _apply_coloring(self, content: str, start: int = 0, rewrite: bool = True) -> None:
         sanitized = content.replace("\n", "")
         self._updating = True
 
         doc = self.document()
-        prev_cursor = self.textCursor()
-        position = min(prev_cursor.position(), len(sanitized))
-        anchor = min(prev_cursor.anchor(), len(sanitized))
+        if rewrite:
+            prev_cursor = self.textCursor()
+            position = min(prev_cursor.position(), len(sanitized))
+            anchor = min(prev_cursor.anchor(), len(sanitized))
+            doc.setPlainText(sanitized)
 
-        doc.setPlainText(sanitized)
+        correct_format, incorrect_format = self._char_formats()
 
+        # Format whole runs of matching / mismatching characters in one call each.
         fmt_cursor = QTextCursor(doc)
-        for idx, char in enumerate(sanitized):
-            fmt_cursor.setPosition(idx)
-            fmt_cursor.movePosition(QTextCursor.Right, QTextCursor.KeepAnchor)
-            fmt = QTextCharFormat()
-            if idx < len(self.target_text) and char == self.target_text[idx]:
-                fmt.setForeground(QColor("#16a34a"))
+        fmt_cursor.beginEditBlock()
+        for run_start, run_end, matched in match_runs(sanitized, self.target_text, start):
+            fmt_cursor.setPosition(run_start)
+            fmt_cursor.setPosition(run_end, QTextCursor.KeepAnchor)
+            fmt_cursor.setCharFormat(correct_format if matched else incorrect_format)
+        fmt_cursor.endEditBlock()
+
+        if rewrite:
+            new_cursor = QTextCursor(doc)
+            if anchor != position:
+                new_cursor.setPosition(min(anchor, position))
+                new_cursor.setPosition(max(anchor, position), QTextCursor.KeepAnchor)
             else:
-                fmt.setForeground(QColor("#dc2626"))
-            fmt_cursor.setCharFormat(fmt)
-
-        new_cursor = QTextCursor(doc)
-        if anchor != position:
-            start = min(anchor, position)
-            end = max(anchor, position)
-            new_cursor.setPosition(start)
-            new_cursor.setPosition(end, QTextCursor.KeepAnchor)
-        else:
-            new_cursor.setPosition(position)
-        self.setTextCursor(new_cursor)
-        self.ensureCursorVisible()
+                new_cursor.setPosition(position)
+            self.setTextCursor(new_cursor)
+            self.ensureCursorVisible()
 
         self._raw_text = sanitized
         self._updating = False
 
 
+class _EssayLoadSignals(QObject):
+    loaded = pyqtSignal(object)
+    failed = pyqtSignal(str)
+
+
+class _EssayLoadTask(QRunnable):
+    """Parses the essay file on a pool thread and reports back via queued signals."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.signals = _EssayLoadSignals()
+
+    def run(self) -> None:
+        try:
+            essays = load_essays()
+        except DataLoaderError as exc:
+            self.signals.failed.emit(str(exc))
+            return
+        self.signals.loaded.emit(essays)
+
+
 @dataclass
 class EssayLineWidget:
     reference_label: QLabel
     input_field: EssayInputField
     target_text: str
+    card: QFrame
+    correct_count: int = 0
+    typed_length: int = 0
+    escaped_chars: List[str] = field(default_factory=list)
 
 
 class EssayPracticeWidget(QWidget):
     def __init__(self, parent: Optional[QWidget] = None) -> None:
         super().__init__(parent)
-        self.essays: List[Essay] = load_essays()
+        self.essays: Sequence[Essay] = ()
         self.current_essay: Optional[Essay] = None
         self.target_text: str = ""
         self.target_lines: List[str] = []
+        self._target_total_len = 0
         self.stats = EssayStats()
         self.current_font_size = 16
+        self._label_template = self._build_label_template(self.current_font_size)
 
         self.title_label: Optional[QLabel] = None
         self.status_label: Optional[QLabel] = None
@@ -141,10 +204,42 @@ class EssayPracticeWidget(QWidget):
         self.font_slider: Optional[QSlider] = None
 
         self.line_widgets: List[EssayLineWidget] = []
+        self._line_pool: List[EssayLineWidget] = []
+        self._load_task: Optional[_EssayLoadTask] = None
+
+        self._status_timer = QTimer(self)
+        self._status_timer.setSingleShot(True)
+        self._status_timer.setInterval(STATUS_REFRESH_MS)
+        self._status_timer.timeout.connect(self._update_status)
+
+        # Reference labels are re-rendered once a burst of keystrokes settles.
+        self._pending_labels: Set[int] = set()
+        self._label_timer = QTimer(self)
+        self._label_timer.setSingleShot(True)
+        self._label_timer.setInterval(LABEL_REFRESH_MS)
+        self._label_timer.timeout.connect(self._flush_label_updates)
 
         self._build_ui()
+        self._start_loading_essays()
+
+    def _start_loading_essays(self) -> None:
+        task = _EssayLoadTask()
+        task.signals.loaded.connect(self._on_essays_loaded)
+        task.signals.failed.connect(self._on_essays_failed)
+        # Keep a reference so the signal emitter outlives the pool thread's run().
+        self._load_task = task
+        QThreadPool.globalInstance().start(task)
+
+    def _on_essays_loaded(self, essays: Sequence[Essay]) -> None:
+        self._load_task = None
+        self.essays = essays
         self._load_random_essay()
 
+    def _on_essays_failed(self, message: str) -> None:
+        self._load_task = None
+        if self.status_label is not None:
+            self.status_label.setText(message)
+
     def _build_ui(self) -> None:
         layout = QVBoxLayout(self)
         layout.setContentsMargins(24, 24, 24, 16)
@@ -207,6 +302,7 @@ class EssayPracticeWidget(QWidget):
         lines_layout = QVBoxLayout(scroll_widget)
         lines_layout.setContentsMargins(0, 0, 0, 0)
         lines_layout.setSpacing(16)
+        lines_layout.addStretch(1)
         self.lines_container = lines_layout
 
         status = QLabel("速度: 0.0 词/分钟 | 正确率: 100.0%")
@@ -217,13 +313,19 @@ class EssayPracticeWidget(QWidget):
 
     def _on_font_size_changed(self, value: int) -> None:
         self.current_font_size = value
+        self._label_template = self._build_label_template(value)
         self._apply_font_size()
 
     def _apply_font_size(self) -> None:
+        # One QFont per size change; fields already using it skip the metrics
+        # query and full recolour that setFont triggers.
+        font: Optional[QFont] = None
         for widget in self.line_widgets:
-            font = widget.input_field.font()
-            font.setPointSize(self.current_font_size)
-            widget.input_field.setFont(font)
+            if font is None:
+                font = widget.input_field.font()
+                font.setPointSize(self.current_font_size)
+            if widget.input_field.font() != font:
+                widget.input_field.setFont(font)
             self._update_label_color(widget)
 
     def _load_random_essay(self) -> None:
@@ -232,6 +334,7 @@ class EssayPracticeWidget(QWidget):
         self.current_essay = random.choice(self.essays)
         self.target_text = self.current_essay.content.strip()
         self.target_lines = self._split_lines(self.target_text)
+        self._target_total_len = sum(map(len, self.target_lines))
         self.stats.reset()
         if self.title_label is not None:
             self.title_label.setText(self.current_essay.title)
@@ -243,43 +346,80 @@ class EssayPracticeWidget(QWidget):
     def _render_lines(self) -> None:
         if self.lines_container is None:
             return
-        # Clear existing widgets
-        self.line_widgets.clear()
-        while self.lines_container.count():
-            item = self.lines_container.takeAt(0)
-            widget = item.widget()
-            if widget is not None:
-                widget.deleteLater()
+        # Suspend painting so the whole batch of line updates costs one repaint.
+        container = self.lines_container.parentWidget()
+        container.setUpdatesEnabled(False)
+        try:
+            self._populate_lines()
+        finally:
+            container.setUpdatesEnabled(True)
+        self._focus_first_entry()
 
+    def _populate_lines(self) -> None:
+        self._label_timer.stop()
+        self._pending_labels.clear()
+        # Line cards are pooled across essays: reuse what exists, only build the
+        # missing ones, and hide the surplus instead of destroying it.
         for index, line_text in enumerate(self.target_lines):
-            line_card = QFrame()
-            line_card.setObjectName("CardFrame")
-            line_card.setStyleSheet("border-radius: 14px; background-color: #fff;")
-            line_layout = QVBoxLayout(line_card)
-            line_layout.setContentsMargins(18, 16, 18, 16)
-            line_layout.setSpacing(12)
-
-            ref_label = QLabel()
-            ref_label.setWordWrap(True)
-            ref_label.setAlignment(Qt.AlignLeft | Qt.AlignTop)
-            ref_label.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Preferred)
-            ref_label.setTextFormat(Qt.RichText)
-            line_layout.addWidget(ref_label)
-
-            input_field = EssayInputField(target_text=line_text)
-            input_field.setPlaceholderText("请逐行跟随范文输入，系统实时判别正确率")
-            input_field.textEdited.connect(lambda text, idx=index: self._on_line_changed(idx, text))
-            input_field.returnPressed.connect(lambda idx=index: self._focus_next(idx))
-            line_layout.addWidget(input_field)
-
-            widget = EssayLineWidget(reference_label=ref_label, input_field=input_field, target_text=line_text)
-            self.lines_container.addWidget(line_card)
-            self.line_widgets.append(widget)
-            self._update_label_color(widget)
+            if index < len(self._line_pool):
+                widget = self._line_pool[index]
+                widget.target_text = line_text
+                widget.escaped_chars = [escape(char) for char in line_text]
+                widget.correct_count = 0
+                widget.typed_length = 0
+                widget.input_field.reset(line_text)
+            else:
+                widget = self._create_line_widget(index, line_text)
+                self._line_pool.append(widget)
+            widget.card.show()
 
-        self.lines_container.addStretch(1)
+        for widget in self._line_pool[len(self.target_lines) :]:
+            widget.card.hide()
+        self.line_widgets = self._line_pool[: len(self.target_lines)]
         self._apply_font_size()
-        self._focus_first_entry()
+
+    def _create_line_widget(self, index: int, line_text: str) -> EssayLineWidget:
+        assert self.lines_container is not None
+        line_card = QFrame()
+        line_card.setObjectName("CardFrame")
+        line_card.setStyleSheet("border-radius: 14px; background-color: #fff;")
+        line_layout = QVBoxLayout(line_card)
+        line_layout.setContentsMargins(18, 16, 18, 16)
+        line_layout.setSpacing(12)
+
+        ref_label = QLabel()
+        ref_label.setWordWrap(True)
+        ref_label.setAlignment(Qt.AlignLeft | Qt.AlignTop)
+        ref_label.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Preferred)
+        ref_label.setTextFormat(Qt.RichText)
+        line_layout.addWidget(ref_label)
+
+        input_field = EssayInputField(target_text=line_text, line_index=index)
+        input_field.setPlaceholderText("请逐行跟随范文输入，系统实时判别正确率")
+        input_field.textEdited.connect(self._dispatch_line_changed)
+        input_field.returnPressed.connect(self._dispatch_focus_next)
+        line_layout.addWidget(input_field)
+
+        # Keep the trailing stretch last.
+        self.lines_container.insertWidget(self.lines_container.count() - 1, line_card)
+        return EssayLineWidget(
+            reference_label=ref_label,
+            input_field=input_field,
+            target_text=line_text,
+            escaped_chars=[escape(char) for char in line_text],
+            card=line_card,
+        )
+
+    def _dispatch_line_changed(self, text: str) -> None:
+        # Single slot shared by every line; the sender carries its own index.
+        sender = self.sender()
+        if isinstance(sender, EssayInputField):
+            self._on_line_changed(sender.line_index, text)
+
+    def _dispatch_focus_next(self) -> None:
+        sender = self.sender()
+        if isinstance(sender, EssayInputField):
+            self._focus_next(sender.line_index)
 
     def _focus_first_entry(self) -> None:
         if not self.line_widgets:
@@ -296,69 +436,69 @@ class EssayPracticeWidget(QWidget):
     @staticmethod
     def _split_lines(text: str) -> List[str]:
         words = text.split()
-        lines: List[str] = []
-        current: List[str] = []
-        for word in words:
-            current.append(word)
-            if len(current) >= 12:
-                lines.append(" ".join(current))
-                current = []
-        if current:
-            lines.append(" ".join(current))
-        return lines
+        return [" ".join(words[i : i + WORDS_PER_LINE]) for i in range(0, len(words), WORDS_PER_LINE)]
+
+    @staticmethod
+    def _build_label_template(font_size: int) -> str:
+        return (
+            f'<div style="font-size: {font_size}px; font-weight: 500; '
+            'line-height: 1.6; white-space: pre-wrap;">{}</div>'
+        )
 
     def _update_label_color(self, widget: EssayLineWidget) -> None:
         typed_text = widget.input_field.text()
         target_line = widget.target_text
-        typed_length = len(typed_text)
+        escaped_chars = widget.escaped_chars
 
+        # One span per run of equally coloured characters instead of one per character.
         segments: List[str] = []
-        for idx, char in enumerate(target_line):
-            if idx < typed_length:
-                if typed_text[idx] == char:
-                    color = "#16a34a"
-                else:
-                    color = "#dc2626"
-            else:
-                color = "#1e293b"
-
-            safe_char = escape(char)
-            segments.append(f'<span style="color: {color};">{safe_char}</span>')
-
-        styled_text = (
-            f'<div style="font-size: {self.current_font_size}px; font-weight: 500; '
-            f'line-height: 1.6; white-space: pre-wrap;">{"".join(segments)}</div>'
-        )
-        widget.reference_label.setText(styled_text)
+        position = 0
+        for run_start, run_end, matched in match_runs(typed_text, target_line):
+            if run_start >= len(target_line):
+                break
+            position = min(run_end, len(target_line))
+            segments.append(_RUN_PREFIXES[matched] + "".join(escaped_chars[run_start:position]) + SPAN_END)
+        if position < len(target_line):
+            segments.append(PENDING_SPAN + "".join(escaped_chars[position:]) + SPAN_END)
+        widget.reference_label.setText(self._label_template.format("".join(segments)))
 
     def _on_line_changed(self, index: int, _text: str) -> None:
         if not (0 <= index < len(self.line_widgets)):
             return
         widget = self.line_widgets[index]
-        self._update_label_color(widget)
-
-        self._refresh_stats_and_status()
-
-    def _refresh_stats_and_status(self) -> None:
-        typed_segments = [widget.input_field.text().strip() for widget in self.line_widgets]
-        typed_text = "\n".join(typed_segments).rstrip()
-        target = "\n".join(self.target_lines).rstrip()
+        self._pending_labels.add(index)
+        self._label_timer.start()
 
-        correct_chars = 0
-        total_chars = len(typed_text)
-        compare_length = min(len(typed_text), len(target))
+        self._refresh_stats_and_status(widget)
 
-        for idx in range(compare_length):
-            if typed_text[idx] == target[idx]:
-                correct_chars += 1
+    def _flush_label_updates(self) -> None:
+        pending, self._pending_labels = self._pending_labels, set()
+        for index in pending:
+            if index < len(self.line_widgets):
+                self._update_label_color(self.line_widgets[index])
 
-        self.stats.correct_letters = correct_chars
-        self.stats.total_letters = total_chars
-        self._update_status()
+    def _refresh_stats_and_status(self, widget: EssayLineWidget) -> None:
+        # Only the edited line is rescanned; totals are adjusted by its delta.
+        typed_text = widget.input_field.text().strip()
+        correct_chars = count_matches(typed_text, widget.target_text)
+        typed_length = len(typed_text)
 
-        if target and typed_text == target:
-            self.stats.register_completion(len(target))
-            self._update_status()
+        self.stats.correct_letters += correct_chars - widget.correct_count
+        self.stats.total_letters += typed_length - widget.typed_length
+        widget.correct_count = correct_chars
+        widget.typed_length = typed_length
+        self._schedule_status_update()
+
+        # Every line is bounded by its target, so matching totals mean every line is complete.
+        if self._target_total_len and (
+            self.stats.correct_letters == self.stats.total_letters == self._target_total_len
+        ):
+            self.stats.register_completion(self._target_total_len)
+
+    def _schedule_status_update(self) -> None:
+        # Keystrokes only arm the timer; the label is refreshed at most every 100 ms.
+        if not self._status_timer.isActive():
+            self._status_timer.start()
 
     def _update_status(self) -> None:
         if self.status_label is None:
@@ -14,6 +14,78 @@ from app.ui.pk_mode import PkModeWidget
 from app.ui.word_practice import WordPracticeWidget
 
 
+GLOBAL_STYLESHEET = """
+    QWidget {
+        font-family: "Microsoft YaHei", "Source Han Sans", "Helvetica Neue", Arial, sans-serif;
+        font-size: 14px;
+        color: #1f2933;
+    }
+    QMainWindow {
+        background-color: #f4f6fb;
+    }
+    QFrame#CardFrame {
+        background-color: #ffffff;
+        border-radius: 18px;
+        border: 1px solid rgba(26,115,232,0.08);
+    }
+    QPushButton {
+        background-color: #1a73e8;
+        color: #ffffff;
+        border-radius: 10px;
+        padding: 8px 18px;
+        font-weight: 600;
+    }
+    QPushButton:hover {
+        background-color: #1557b0;
+    }
+    QPushButton:disabled {
+        background-color: #cbd6ee;
+        color: #ffffff;
+    }
+    QComboBox, QLineEdit, QTextEdit, QSpinBox {
+        border: 1px solid #d0d7e3;
+        border-radius: 10px;
+        padding: 6px 12px;
+        background-color: #ffffff;
+    }
+    QListWidget, QScrollArea {
+        border: 1px solid #d0d7e3;
+        border-radius: 14px;
+        background-color: #ffffff;
+    }
+    QTabWidget::pane {
+        border: none;
+    }
+    QTabBar::tab {
+        background: #e8ecf5;
+        color: #4a5568;
+        border-top-left-radius: 14px;
+        border-top-right-radius: 14px;
+        padding: 10px 22px;
+        margin-right: 6px;
+        font-weight: 600;
+    }
+    QTabBar::tab:selected {
+        background: #ffffff;
+        color: #1a73e8;
+    }
+    QLabel#TitleLabel {
+        font-size: 28px;
+        font-weight: 700;
+        color: #1f2933;
+    }
+    QLabel#SectionHeader {
+        font-size: 16px;
+        font-weight: 600;
+        color: #334155;
+    }
+    QLabel#StatusLabel {
+        color: #1a73e8;
+        font-weight: 600;
+    }
+    """
+
+
 def _apply_global_theme(app: QApplication) -> None:
     app.setStyle("Fusion")
 
@@ -36,78 +108,7 @@ def _apply_global_theme(app: QApplication) -> None:
     palette.setColor(QPalette.HighlightedText, QColor("#ffffff"))
     app.setPalette(palette)
 
-    app.setStyleSheet(
-        """
-        QWidget {
-            font-family: "Microsoft YaHei", "Source Han Sans", "Helvetica Neue", Arial, sans-serif;
-            font-size: 14px;
-            color: #1f2933;
-        }
-        QMainWindow {
-            background-color: #f4f6fb;
-        }
-        QFrame#CardFrame {
-            background-color: #ffffff;
-            border-radius: 18px;
-            border: 1px solid rgba(26,115,232,0.08);
-        }
-        QPushButton {
-            background-color: #1a73e8;
-            color: #ffffff;
-            border-radius: 10px;
-            padding: 8px 18px;
-            font-weight: 600;
-        }
-        QPushButton:hover {
-            background-color: #1557b0;
-        }
-        QPushButton:disabled {
-            background-color: #cbd6ee;
-            color: #ffffff;
-        }
-        QComboBox, QLineEdit, QTextEdit, QSpinBox {
-            border: 1px solid #d0d7e3;
-            border-radius: 10px;
-            padding: 6px 12px;
-            background-color: #ffffff;
-        }
-        QListWidget, QScrollArea {
-            border: 1px solid #d0d7e3;
-            border-radius: 14px;
-            background-color: #ffffff;
-        }
-        QTabWidget::pane {
-            border: none;
-        }
-        QTabBar::tab {
-            background: #e8ecf5;
-            color: #4a5568;
-            border-top-left-radius: 14px;
-            border-top-right-radius: 14px;
-            padding: 10px 22px;
-            margin-right: 6px;
-            font-weight: 600;
-        }
-        QTabBar::tab:selected {
-            background: #ffffff;
-            color: #1a73e8;
-        }
-        QLabel#TitleLabel {
-            font-size: 28px;
-            font-weight: 700;
-            color: #1f2933;
-        }
-        QLabel#SectionHeader {
-            font-size: 16px;
-            font-weight: 600;
-            color: #334155;
-        }
-        QLabel#StatusLabel {
-            color: #1a73e8;
-            font-weight: 600;
-        }
-        """
-    )
+    app.setStyleSheet(GLOBAL_STYLESHEET)
 
 
 class MainWindow(QMainWindow):
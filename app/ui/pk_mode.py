@@ -1,11 +1,12 @@
 from __future__ import annotations
 
 import json
-import queue
 import re
-from typing import Dict, Optional
+import threading
+from functools import partial
+from typing import Callable, Dict, List, Optional
 
-from PyQt5.QtCore import Qt, QTimer
+from PyQt5.QtCore import Qt, QTimer, pyqtSignal
 from PyQt5.QtGui import QColor, QTextCharFormat, QTextCursor
 from PyQt5.QtWidgets import (
     QDialog,
@@ -25,19 +26,92 @@ from PyQt5.QtWidgets import (
 
 from app.core.network_utils import get_local_ip
 from app.core.stats import EssayStats
+from app.core.text_compare import common_prefix_length, count_matches, match_runs
 from app.network.pk_client import PkClient
 from app.network.pk_server import PK_PORT, PkServer
 
 BANNED_KEYWORDS = {"傻", "笨", "蠢", "操", "妈", "垃圾", "滚", "死"}
+_BANNED_RE = re.compile("|".join(map(re.escape, sorted(BANNED_KEYWORDS))))
+_STUDENT_ID_RE = re.compile(r"\d{8}")
+_CN_NAME_RE = re.compile("[\u4e00-\u9fff]{2,4}")
+TEXT_UPDATE_INTERVAL_MS = 16
+STATUS_TEMPLATE = (
+    "我的进度: {my_progress:.1f}% | 我的速度: {my_speed:.1f} 词/分钟 | 我的正确率: {my_accuracy:.1f}%"
+    " | {opponent} 进度: {opponent_progress:.1f}% | {opponent} 速度: {opponent_speed:.1f} 词/分钟"
+    " | {opponent} 正确率: {opponent_accuracy:.1f}%"
+)
+
+
+def _as_float(value: object, default: float = 0.0) -> float:
+    if isinstance(value, float):
+        # Decoded JSON numbers are normally floats already.
+        return value
+    try:
+        return float(value)  # type: ignore[arg-type]
+    except (TypeError, ValueError):
+        return default
+
+
+def _format_results(results: object) -> str:
+    if not isinstance(results, dict):
+        return json.dumps(results, ensure_ascii=False)
+    lines = []
+    for student_id, stats in results.items():
+        if not isinstance(stats, dict) or not set(stats) <= {"accuracy", "speed"}:
+            lines.append(f"{student_id}: {json.dumps(stats, ensure_ascii=False)}")
+            continue
+        accuracy = _as_float(stats.get("accuracy"))
+        speed = _as_float(stats.get("speed"))
+        lines.append(f"{student_id}: 正确率 {accuracy * 100:.1f}% | 速度 {speed:.1f} 词/分钟")
+    return "\n".join(lines)
+
+
+def _coalesce_key(message: dict) -> Optional[tuple]:
+    msg_type = message.get("type")
+    if msg_type == "user_list":
+        return (msg_type,)
+    if msg_type == "progress_update":
+        return (msg_type, message.get("challenge_id"), message.get("student_id"))
+    if msg_type == "challenge_result":
+        return (msg_type, message.get("challenge_id"))
+    if msg_type == "challenge_request":
+        # A challenger re-sending before we drained should only prompt once.
+        challenger = message.get("from")
+        if isinstance(challenger, dict) and challenger.get("student_id"):
+            return (msg_type, challenger["student_id"])
+    return None
+
+
+def _coalesce_messages(batch: List[dict]) -> List[dict]:
+    """Keep only the newest snapshot-style message per key, preserving order."""
+    seen = set()
+    kept: List[dict] = []
+    for message in reversed(batch):
+        key = _coalesce_key(message)
+        if key is not None:
+            try:
+                if key in seen:
+                    continue
+                seen.add(key)
+            except TypeError:
+                # Ids that are lists or objects cannot be keys; keep the message as is.
+                pass
+        kept.append(message)
+    kept.reverse()
+    return kept
 
 
 class PkModeWidget(QWidget):
+    # Emitted from the client's listener thread when the pending batch becomes
+    # non-empty; delivered on the GUI thread.
+    messages_pending = pyqtSignal()
+
     def __init__(self, parent: Optional[QWidget] = None) -> None:
         super().__init__(parent)
         self.server: Optional[PkServer] = None
         self.client: Optional[PkClient] = None
-        self.message_queue: "queue.Queue[dict]" = queue.Queue()
         self.users: Dict[str, dict] = {}
+        self._user_items: Dict[str, QListWidgetItem] = {}
         self.local_ip = get_local_ip()
         self.current_challenge_id: Optional[str] = None
         self.challenge_dialog: Optional[ChallengeDialog] = None
@@ -53,9 +127,17 @@ class PkModeWidget(QWidget):
         self._set_status("未连接")
         self._ensure_server()
 
-        self._message_timer = QTimer(self)
-        self._message_timer.timeout.connect(self._process_messages)
-        self._message_timer.start(200)
+        self._handlers: Dict[str, Callable[[dict], None]] = {
+            "user_list": self._handle_user_list,
+            "challenge_request": self._handle_challenge_request,
+            "challenge_response": self._handle_challenge_response,
+            "start_challenge": self._handle_start_challenge,
+            "progress_update": self._handle_progress_update,
+            "challenge_result": self._handle_challenge_result,
+        }
+        self._pending_messages: List[dict] = []
+        self._pending_lock = threading.Lock()
+        self.messages_pending.connect(self._process_messages, Qt.QueuedConnection)
 
     def _build_ui(self) -> None:
         layout = QVBoxLayout(self)
@@ -152,7 +234,8 @@ class PkModeWidget(QWidget):
             return
         prefix = f"本机 IP：{self.local_ip}"
         message = f"{prefix} | {text}" if text else prefix
-        self.status_label.setText(message)
+        if self.status_label.text() != message:
+            self.status_label.setText(message)
 
     def _on_connect(self) -> None:
         if self.student_id_input is None or self.name_input is None:
@@ -160,18 +243,18 @@ class PkModeWidget(QWidget):
         student_id = self.student_id_input.text().strip()
         name = self.name_input.text().strip()
 
-        if not re.fullmatch(r"\d{8}", student_id):
+        if not _STUDENT_ID_RE.fullmatch(student_id):
             QMessageBox.warning(self, "输入错误", "学号必须是 8 位数字")
             return
-        if not (2 <= len(name) <= 4) or not all("\u4e00" <= ch <= "\u9fff" for ch in name):
+        if not _CN_NAME_RE.fullmatch(name):
             QMessageBox.warning(self, "输入错误", "姓名必须为 2-4 个中文字符")
             return
-        if any(keyword in name for keyword in BANNED_KEYWORDS):
+        if _BANNED_RE.search(name) is not None:
             QMessageBox.warning(self, "输入错误", "请勿使用不文明的称呼")
             return
 
         if self.client is None:
-            self.client = PkClient(on_message=self.message_queue.put)
+            self.client = PkClient(on_message=self._on_client_message)
 
         self.client.register(student_id, name)
         if self.connect_button is not None:
@@ -193,54 +276,72 @@ class PkModeWidget(QWidget):
             self.disconnect_button.setEnabled(False)
         self._set_status("已断开连接")
 
+    def _on_client_message(self, message: dict) -> None:
+        with self._pending_lock:
+            self._pending_messages.append(message)
+            first = len(self._pending_messages) == 1
+        if first:
+            self.messages_pending.emit()
+
     def _process_messages(self) -> None:
-        try:
-            while True:
-                message = self.message_queue.get_nowait()
-                self._handle_message(message)
-        except queue.Empty:
-            return
+        with self._pending_lock:
+            batch, self._pending_messages = self._pending_messages, []
+        for message in _coalesce_messages(batch):
+            self._handle_message(message)
 
     def _handle_message(self, message: dict) -> None:
         msg_type = message.get("type")
-        if msg_type == "user_list":
-            self._handle_user_list(message)
-        elif msg_type == "challenge_request":
-            self._handle_challenge_request(message)
-        elif msg_type == "challenge_response":
-            self._handle_challenge_response(message)
-        elif msg_type == "start_challenge":
-            self._handle_start_challenge(message)
-        elif msg_type == "progress_update":
-            self._handle_progress_update(message)
-        elif msg_type == "challenge_result":
-            self._handle_challenge_result(message)
+        if not isinstance(msg_type, str):
+            return
+        handler = self._handlers.get(msg_type)
+        if handler is not None:
+            handler(message)
 
     def _handle_user_list(self, message: dict) -> None:
         users = message.get("users", [])
         my_id = self.client.student_id if self.client else None
-        self.users = {}
+        latest: Dict[str, dict] = {}
         for user in users:
             student_id = user.get("student_id")
             if not student_id or student_id == my_id:
                 continue
-            self.users[student_id] = {
+            latest[student_id] = {
                 "name": user.get("name", "未知"),
                 "ip": user.get("ip", "未知"),
             }
-        self._refresh_user_list()
+        # Broadcasts usually repeat the same roster; only touch the list on change.
+        if latest != self.users:
+            for student_id in self.users.keys() - latest.keys():
+                del self.users[student_id]
+            self.users.update(latest)
+            self._refresh_user_list()
         self._set_status(f"当前在线 {len(users)} 人")
 
     def _refresh_user_list(self) -> None:
         if self.user_list is None:
             return
-        self.user_list.clear()
+        self.user_list.setUpdatesEnabled(False)
+        try:
+            self._sync_user_items()
+        finally:
+            self.user_list.setUpdatesEnabled(True)
+
+    def _sync_user_items(self) -> None:
+        for student_id in set(self._user_items) - set(self.users):
+            item = self._user_items.pop(student_id)
+            self.user_list.takeItem(self.user_list.row(item))
         for student_id, info in self.users.items():
             name = info.get("name", "未知")
             ip = info.get("ip", "未知")
-            item = QListWidgetItem(f"{name} ({student_id}) - {ip}")
-            item.setData(Qt.UserRole, student_id)
-            self.user_list.addItem(item)
+            text = f"{name} ({student_id}) - {ip}"
+            item = self._user_items.get(student_id)
+            if item is None:
+                item = QListWidgetItem(text)
+                item.setData(Qt.UserRole, student_id)
+                self.user_list.addItem(item)
+                self._user_items[student_id] = item
+            elif item.text() != text:
+                item.setText(text)
 
     def _on_user_double_click(self, item: QListWidgetItem) -> None:
         if self.client is None or item is None:
@@ -261,6 +362,13 @@ class PkModeWidget(QWidget):
         challenger_ip = challenger.get("ip", "未知")
         if not challenger_id or self.client is None:
             return
+        # Ask outside the message handler so the rest of the batch is processed
+        # before the modal prompt's nested event loop starts.
+        QTimer.singleShot(
+            0, partial(self._prompt_challenge, challenger_id, challenger_name, challenger_ip)
+        )
+
+    def _prompt_challenge(self, challenger_id: str, challenger_name: str, challenger_ip: str) -> None:
         reply = QMessageBox.question(
             self,
             "收到挑战",
@@ -268,6 +376,8 @@ class PkModeWidget(QWidget):
             QMessageBox.Yes | QMessageBox.No,
             QMessageBox.Yes,
         )
+        if self.client is None:
+            return
         accept = reply == QMessageBox.Yes
         self.client.respond_challenge(challenger_id, accept)
         if accept:
@@ -284,8 +394,8 @@ class PkModeWidget(QWidget):
         if accepted:
             self._set_status(f"{responder_name} ({responder_ip}) 接受了您的挑战，准备中...")
         else:
-            QMessageBox.information(self, "提示", "对方不接受您的挑战")
             self._set_status(f"{responder_name} ({responder_ip}) 拒绝了挑战")
+            QTimer.singleShot(0, partial(QMessageBox.information, self, "提示", "对方不接受您的挑战"))
 
     def _handle_start_challenge(self, message: dict) -> None:
         if self.client is None:
@@ -325,18 +435,9 @@ class PkModeWidget(QWidget):
         if message.get("challenge_id") != self.current_challenge_id:
             return
         student_id = message.get("student_id")
-        try:
-            progress = float(message.get("progress", 0.0))
-        except (TypeError, ValueError):
-            progress = 0.0
-        try:
-            accuracy = float(message.get("accuracy", 0.0))
-        except (TypeError, ValueError):
-            accuracy = 0.0
-        try:
-            speed = float(message.get("speed", 0.0))
-        except (TypeError, ValueError):
-            speed = 0.0
+        progress = _as_float(message.get("progress"))
+        accuracy = _as_float(message.get("accuracy"))
+        speed = _as_float(message.get("speed"))
         self.challenge_dialog.handle_progress_update(student_id, progress, accuracy, speed)
 
     def _on_challenge_dialog_closed(self, _obj=None) -> None:
@@ -362,12 +463,9 @@ class PkModeWidget(QWidget):
             text = "挑战结果：您获胜了！"
         else:
             text = "挑战结果：对方获胜"
-        details = json.dumps(results, ensure_ascii=False, indent=2)
-        QMessageBox.information(self, "挑战结果", f"{text}\n详细数据:\n{details}")
+        ResultDialog(text, results, parent=self).open()
 
     def shutdown(self) -> None:
-        if self._message_timer.isActive():
-            self._message_timer.stop()
         if self.challenge_dialog is not None:
             self.challenge_dialog.close()
             self.challenge_dialog = None
@@ -398,6 +496,7 @@ class ChallengeDialog(QDialog):
         self.challenge_id = challenge_id
         self.essay_title = essay_title
         self.essay_content = essay_content.strip()
+        self._target_len = len(self.essay_content)
         self.opponent_name = opponent_name
         self.opponent_ip = opponent_ip
         self.stats = EssayStats()
@@ -423,10 +522,23 @@ class ChallengeDialog(QDialog):
         self._opponent_speed = 0.0
         self._last_reported_length = -1
         self._last_reported_progress = -1.0
-        self._last_reported_accuracy = -1.0
-        self._last_reported_speed = -1.0
+        self._last_reported_correct = -1
+        self._last_status_text = ""
+        self._highlighting = False
+        self._last_typed = ""
+        self._correct_count = 0
+        self._fmt_correct = QTextCharFormat()
+        self._fmt_correct.setForeground(QColor("#16a34a"))
+        self._fmt_incorrect = QTextCharFormat()
+        self._fmt_incorrect.setForeground(QColor("#dc2626"))
+
+        self._text_update_timer = QTimer(self)
+        self._text_update_timer.setSingleShot(True)
+        self._text_update_timer.setInterval(TEXT_UPDATE_INTERVAL_MS)
+        self._text_update_timer.timeout.connect(self._do_text_update)
 
         self._build_ui()
+        self._hl_cursor = QTextCursor(self.user_text.document())
         self._refresh_status_text()
         self._render_reference()
         self._start_countdown()
@@ -515,6 +627,8 @@ class ChallengeDialog(QDialog):
         user_text.setPlaceholderText("请在此处输入您的文本，系统实时标色反馈")
         user_text.setStyleSheet("font-size: 14px; line-height: 1.6;")
         user_text.setReadOnly(True)
+        # Highlighting is applied as char-format edits; keep them off the undo stack.
+        user_text.setUndoRedoEnabled(False)
         user_text.textChanged.connect(self._on_text_change)
         panel_layout.addWidget(user_text, stretch=1)
         self.user_text = user_text
@@ -537,17 +651,17 @@ class ChallengeDialog(QDialog):
         self.reference_text.setPlainText(self.essay_content)
 
     def _start_countdown(self) -> None:
-        self.countdown_timer = QTimer(self)
-        self.countdown_timer.timeout.connect(self._tick_countdown)
-        self.countdown_timer.start(1000)
+        # Each tick schedules the next one, so nothing is left running once the
+        # countdown ends; the dialog being deleted cancels any pending tick.
+        QTimer.singleShot(1000, self._tick_countdown)
 
     def _tick_countdown(self) -> None:
         if self.countdown_value > 0:
             if self.countdown_label is not None:
                 self.countdown_label.setText(f"挑战将在 {self.countdown_value} 秒后开始")
             self.countdown_value -= 1
+            QTimer.singleShot(1000, self._tick_countdown)
         else:
-            self.countdown_timer.stop()
             if self.countdown_label is not None:
                 self.countdown_label.setText("挑战开始！")
             if self.user_text is not None:
@@ -558,34 +672,48 @@ class ChallengeDialog(QDialog):
             self._report_progress(0.0, 0, force=True)
 
     def _on_text_change(self) -> None:
+        if self._highlighting or self.user_text is None or self.user_text.isReadOnly():
+            return
+        # At most one update per frame: a pending pass is left to run rather than
+        # restarted, so sustained fast typing cannot postpone highlighting. React
+        # at once when the length says the essay may have just been completed.
+        typed_length = self.user_text.document().characterCount() - 1
+        if typed_length == self._target_len:
+            self._text_update_timer.stop()
+            self._do_text_update()
+        elif not self._text_update_timer.isActive():
+            self._text_update_timer.start()
+
+    def _do_text_update(self) -> None:
         if self.user_text is None or self.user_text.isReadOnly():
             return
         typed = self.user_text.toPlainText()
         target = self.essay_content
 
-        self._highlight_text(typed, target)
-
-        correct_chars = 0
-        compare_len = min(len(typed), len(target))
-        for idx in range(compare_len):
-            if typed[idx] == target[idx]:
-                correct_chars += 1
+        # Only the part after the last snapshot's common prefix can have changed.
+        common = common_prefix_length(typed, self._last_typed)
+        self._highlight_text(typed, target, common)
+        self._correct_count += count_matches(typed[common:], target[common:]) - count_matches(
+            self._last_typed[common:], target[common:]
+        )
+        self._last_typed = typed
 
-        self.stats.correct_letters = correct_chars
-        self.stats.total_letters = len(typed)
+        self.stats.correct_letters = self._correct_count
+        typed_length = len(typed)
+        self.stats.total_letters = typed_length
 
         progress = 0.0
-        if target:
-            progress = min(len(typed) / len(target), 1.0)
+        if self._target_len:
+            progress = min(typed_length / self._target_len, 1.0)
 
         self._update_own_progress(progress)
-        self._report_progress(progress, len(typed))
+        self._report_progress(progress, typed_length)
 
-        if target and typed == target and not self.submitted:
+        if target and typed_length == self._target_len and typed == target and not self.submitted:
             self.submitted = True
-            self.stats.register_completion(len(target))
+            self.stats.register_completion(self._target_len)
             self._update_own_progress(1.0)
-            self._report_progress(1.0, len(target), force=True)
+            self._report_progress(1.0, self._target_len, force=True)
             if self.user_text is not None:
                 self.user_text.setReadOnly(True)
             self.client.submit_result(self.challenge_id, self.stats.accuracy, self.stats.words_per_minute)
@@ -593,40 +721,27 @@ class ChallengeDialog(QDialog):
                 self.result_label.setText("成绩已提交，等待对手完成...")
                 self.result_label.setStyleSheet("color: #1a73e8;")
 
-    def _highlight_text(self, typed: str, target: str) -> None:
+    def _highlight_text(self, typed: str, target: str, start: int = 0) -> None:
         if self.user_text is None:
             return
-        cursor_backup = self.user_text.textCursor()
-
-        doc = self.user_text.document()
-        default_format = QTextCharFormat()
-        default_format.setForeground(QColor("#1f2933"))
-
-        cursor = QTextCursor(doc)
-        cursor.select(QTextCursor.Document)
-        cursor.setCharFormat(default_format)
-
-        correct_format = QTextCharFormat()
-        correct_format.setForeground(QColor("#16a34a"))
-        incorrect_format = QTextCharFormat()
-        incorrect_format.setForeground(QColor("#dc2626"))
-
-        compare_len = min(len(typed), len(target))
-
-        for idx in range(compare_len):
-            fmt = correct_format if typed[idx] == target[idx] else incorrect_format
-            char_cursor = QTextCursor(doc)
-            char_cursor.setPosition(idx)
-            char_cursor.movePosition(QTextCursor.Right, QTextCursor.KeepAnchor)
-            char_cursor.setCharFormat(fmt)
-
-        for idx in range(compare_len, len(typed)):
-            char_cursor = QTextCursor(doc)
-            char_cursor.setPosition(idx)
-            char_cursor.movePosition(QTextCursor.Right, QTextCursor.KeepAnchor)
-            char_cursor.setCharFormat(incorrect_format)
-
-        self.user_text.setTextCursor(cursor_backup)
+        # The runs cover every typed character from ``start``, so no separate reset pass is needed.
+        runs = match_runs(typed, target, start)
+        if not runs:
+            return
+        # Formatting goes through a private cursor, so the user's cursor and
+        # selection are never moved and need no save/restore. The flag keeps the
+        # resulting textChanged from re-entering _on_text_change.
+        run_cursor = self._hl_cursor
+        self._highlighting = True
+        run_cursor.beginEditBlock()
+        try:
+            for run_start, end, matched in runs:
+                run_cursor.setPosition(run_start)
+                run_cursor.setPosition(end, QTextCursor.KeepAnchor)
+                run_cursor.setCharFormat(self._fmt_correct if matched else self._fmt_incorrect)
+        finally:
+            run_cursor.endEditBlock()
+            self._highlighting = False
 
     def _update_own_progress(self, progress: float) -> None:
         progress = max(0.0, min(progress, 1.0))
@@ -638,20 +753,20 @@ class ChallengeDialog(QDialog):
     def _report_progress(self, progress: float, typed_length: int, force: bool = False) -> None:
         if self.client is None or not self.challenge_id:
             return
+        # Plain int/float checks first; a same-length substitution still shows up
+        # in the correct count, so the stats properties are only read when sending.
+        if (
+            not force
+            and typed_length == self._last_reported_length
+            and self.stats.correct_letters == self._last_reported_correct
+            and abs(progress - self._last_reported_progress) < 1e-3
+        ):
+            return
         accuracy = self.stats.accuracy
         speed = self.stats.words_per_minute
-        if not force:
-            if (
-                typed_length == self._last_reported_length
-                and abs(progress - self._last_reported_progress) < 1e-3
-                and abs(accuracy - self._last_reported_accuracy) < 1e-3
-                and abs(speed - self._last_reported_speed) < 1e-3
-            ):
-                return
         self._last_reported_length = typed_length
         self._last_reported_progress = progress
-        self._last_reported_accuracy = accuracy
-        self._last_reported_speed = speed
+        self._last_reported_correct = self.stats.correct_letters
         self.client.send_progress(
             self.challenge_id,
             accuracy,
@@ -680,15 +795,18 @@ class ChallengeDialog(QDialog):
     def _refresh_status_text(self) -> None:
         if self.status_label is None:
             return
-        text_parts = [
-            f"我的进度: {self._my_progress * 100:.1f}%",
-            f"我的速度: {self.stats.words_per_minute:.1f} 词/分钟",
-            f"我的正确率: {self.stats.accuracy * 100:.1f}%",
-            f"{self.opponent_name} 进度: {self._opponent_progress * 100:.1f}%",
-            f"{self.opponent_name} 速度: {self._opponent_speed:.1f} 词/分钟",
-            f"{self.opponent_name} 正确率: {self._opponent_accuracy * 100:.1f}%",
-        ]
-        self.status_label.setText(" | ".join(text_parts))
+        text = STATUS_TEMPLATE.format(
+            my_progress=self._my_progress * 100,
+            my_speed=self.stats.words_per_minute,
+            my_accuracy=self.stats.accuracy * 100,
+            opponent=self.opponent_name,
+            opponent_progress=self._opponent_progress * 100,
+            opponent_speed=self._opponent_speed,
+            opponent_accuracy=self._opponent_accuracy * 100,
+        )
+        if text != self._last_status_text:
+            self._last_status_text = text
+            self.status_label.setText(text)
 
     def show_result(self, winner: Optional[str], results: dict, my_id: Optional[str]) -> None:
         if self.result_label is None:
@@ -731,12 +849,53 @@ class ChallengeDialog(QDialog):
 
         self._refresh_status_text()
 
-        details = json.dumps(results, ensure_ascii=False, indent=2)
         self.result_label.setText(text)
         self.result_label.setStyleSheet(f"color: {color};")
-        QMessageBox.information(self, "挑战结果", f"{text}\n详细数据:\n{details}")
+        ResultDialog(text, results, parent=self).open()
 
     def closeEvent(self, event) -> None:  # type: ignore[override]
-        if hasattr(self, "countdown_timer") and self.countdown_timer.isActive():
-            self.countdown_timer.stop()
+        self._text_update_timer.stop()
         super().closeEvent(event)
+
+
+class ResultDialog(QDialog):
+    """Non-blocking result summary; the raw results are only formatted on request."""
+
+    def __init__(self, text: str, results: dict, parent: Optional[QWidget] = None) -> None:
+        super().__init__(parent)
+        self.setAttribute(Qt.WA_DeleteOnClose, True)
+        self.setWindowTitle("挑战结果")
+        self.results = results
+        self._details_loaded = False
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(20, 20, 20, 20)
+        layout.setSpacing(12)
+
+        message = QLabel(text)
+        message.setWordWrap(True)
+        message.setStyleSheet("font-size: 16px; font-weight: 600;")
+        layout.addWidget(message)
+
+        details_button = QPushButton("查看详细数据")
+        details_button.clicked.connect(self._toggle_details)
+        layout.addWidget(details_button)
+        self.details_button = details_button
+
+        details_view = QTextEdit()
+        details_view.setReadOnly(True)
+        details_view.hide()
+        layout.addWidget(details_view, stretch=1)
+        self.details_view = details_view
+
+        close_button = QPushButton("确定")
+        close_button.clicked.connect(self.accept)
+        layout.addWidget(close_button)
+
+    def _toggle_details(self) -> None:
+        if not self._details_loaded:
+            self.details_view.setPlainText(_format_results(self.results))
+            self._details_loaded = True
+        visible = not self.details_view.isVisible()
+        self.details_view.setVisible(visible)
+        self.details_button.setText("收起详细数据" if visible else "查看详细数据")
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 import random
-from typing import List, Optional
+from html import escape
+from typing import Callable, List, Optional, Sequence
 
 from PyQt5.QtCore import Qt, QTimer
 from PyQt5.QtGui import QFont
@@ -20,9 +21,16 @@ from PyQt5.QtWidgets import (
 )
 
 from app.core.audio import TextToSpeech
-from app.core.data_loader import WordEntry, load_words
+from app.core.data_loader import DataLoaderError, WordEntry, load_words
 from app.core.stats import PracticeStats
 
+LETTER_DEFAULT_SPAN = '<span style="color: #1e293b;">'
+LETTER_CORRECT_SPAN = '<span style="color: #16a34a;">'
+LETTER_ERROR_SPAN = '<span style="color: #dc2626;">'
+SPAN_END = "</span>"
+# Matches the gap the former one-label-per-letter row had (padding plus spacing).
+LETTER_SPACING_PX = 26
+
 
 class WordPracticeWidget(QWidget):
     def __init__(self, tts: TextToSpeech, parent: Optional[QWidget] = None) -> None:
@@ -30,12 +38,21 @@ class WordPracticeWidget(QWidget):
         self.tts = tts
         self.current_level = "cet4"
         self.current_word: Optional[WordEntry] = None
-        self.word_bank: dict[str, List[WordEntry]] = {
-            "cet4": load_words("cet4"),
-            "cet6": load_words("cet6"),
-        }
-        self.word_queue: List[WordEntry] = []
-        self.letter_labels: List[QLabel] = []
+        self._target_lc = ""
+        # Banks are loaded on first use, so an unused level is never parsed.
+        self.word_bank: dict[str, Sequence[WordEntry]] = {}
+        # Shuffled in place per round; the word banks themselves are never copied.
+        self._index_pools: dict[str, List[int]] = {}
+        # Lowercased words, parallel to each bank and built once per level.
+        self._lc_words: dict[str, List[str]] = {}
+        self._queue_ptr = 0
+        # Long-lived single-shot timers: an active timer doubles as the "already
+        # scheduled" flag, so bursts never stack extra callbacks.
+        self._speak_timer = self._single_shot_timer(self._speak_current_word)
+        self._error_timer = self._single_shot_timer(self._render_current_word)
+        self._next_word_timer = self._single_shot_timer(self._next_word)
+        self._letters_html = ""
+        self._last_status_text = ""
 
         self.stats = PracticeStats()
 
@@ -47,11 +64,18 @@ class WordPracticeWidget(QWidget):
         self.entry: Optional[QLineEdit] = None
         self.status_label: Optional[QLabel] = None
         self.letters_container: Optional[QHBoxLayout] = None
+        self.letter_label: Optional[QLabel] = None
 
         self._build_ui()
         self._reset_queue()
         self._next_word()
 
+    def _single_shot_timer(self, slot: Callable[[], None]) -> QTimer:
+        timer = QTimer(self)
+        timer.setSingleShot(True)
+        timer.timeout.connect(slot)
+        return timer
+
     def _build_ui(self) -> None:
         layout = QVBoxLayout(self)
         layout.setContentsMargins(24, 24, 24, 16)
@@ -136,6 +160,18 @@ class WordPracticeWidget(QWidget):
         inner_layout.addWidget(letter_frame)
         self.letters_container = letter_layout
 
+        letter_font = QFont()
+        letter_font.setPointSize(30)
+        letter_font.setBold(True)
+        letter_font.setLetterSpacing(QFont.AbsoluteSpacing, LETTER_SPACING_PX)
+        # One rich-text label for the whole word: a keystroke repaints a single widget.
+        letter_label = QLabel("")
+        letter_label.setTextFormat(Qt.RichText)
+        letter_label.setFont(letter_font)
+        letter_label.setStyleSheet("padding: 6px 8px;")
+        letter_layout.addWidget(letter_label)
+        self.letter_label = letter_label
+
         entry = QLineEdit()
         entry.setPlaceholderText("请在此输入单词，系统将实时点评您的准确率")
         entry.setAlignment(Qt.AlignCenter)
@@ -153,6 +189,15 @@ class WordPracticeWidget(QWidget):
     def _on_level_change(self, level: str) -> None:
         if level == self.current_level:
             return
+        try:
+            self._ensure_bank(level)
+        except DataLoaderError as exc:
+            QMessageBox.warning(self, "词库加载失败", str(exc))
+            if self.level_combobox is not None:
+                self.level_combobox.blockSignals(True)
+                self.level_combobox.setCurrentText(self.current_level)
+                self.level_combobox.blockSignals(False)
+            return
         self.current_level = level
         self._restart_practice()
 
@@ -161,45 +206,46 @@ class WordPracticeWidget(QWidget):
         self._next_word()
 
     def _reset_queue(self) -> None:
-        base_list = self.word_bank[self.current_level][:]
-        random.shuffle(base_list)
-        self.word_queue = base_list
+        self._ensure_bank(self.current_level)
+        indices = self._index_pools[self.current_level]
+        random.shuffle(indices)
+        self._queue_ptr = len(indices)
         self.stats.reset()
         self._update_status()
 
+    def _ensure_bank(self, level: str) -> None:
+        if level in self.word_bank:
+            return
+        bank = load_words(level)
+        self.word_bank[level] = bank
+        self._index_pools[level] = list(range(len(bank)))
+        self._lc_words[level] = [entry.word.lower() for entry in bank]
+
     def _next_word(self) -> None:
-        if not self.word_queue:
+        if self._queue_ptr == 0:
             QMessageBox.information(self, "练习完成", "该等级的全部单词已练习完毕，系统将为您重新随机排列。")
             self._reset_queue()
-        self.current_word = self.word_queue.pop()
+        self._queue_ptr -= 1
+        index = self._index_pools[self.current_level][self._queue_ptr]
+        self.current_word = self.word_bank[self.current_level][index]
+        self._target_lc = self._lc_words[self.current_level][index]
         if self.entry is not None:
             self.entry.blockSignals(True)
             self.entry.clear()
+            # One character of slack so overrunning the word still counts as an error,
+            # while long pastes are truncated by Qt before reaching Python.
+            self.entry.setMaxLength(len(self._target_lc) + 1)
             self.entry.blockSignals(False)
             self.entry.setFocus()
         self._render_current_word()
         self._play_pronunciation(delay_ms=300)
 
     def _render_current_word(self) -> None:
-        if self.current_word is None or self.letters_container is None:
+        if self.current_word is None or self.letter_label is None:
             return
-        while self.letter_labels:
-            label = self.letter_labels.pop()
-            label.deleteLater()
-        self.letters_container.setSpacing(10)
-
-        font = QFont()
-        font.setPointSize(30)
-        font.setBold(True)
-
-        display_word = self.current_word.word.lower()
+        display_word = self._target_lc
 
-        for char in display_word:
-            lbl = QLabel(char)
-            lbl.setFont(font)
-            lbl.setStyleSheet("color: #1e293b; padding: 6px 8px;")
-            self.letters_container.addWidget(lbl)
-            self.letter_labels.append(lbl)
+        self._show_letters(0)
 
         if self.word_title_label is not None:
             self.word_title_label.setText(display_word)
@@ -210,14 +256,25 @@ class WordPracticeWidget(QWidget):
         if self.example_label is not None:
             self.example_label.setText(f"例句：{self.current_word.example}")
 
-        for label in self.letter_labels:
-            label.setStyleSheet("color: #1e293b; padding: 6px 8px;")
+    def _show_letters(self, typed_length: int, error: bool = False) -> None:
+        word = self._target_lc
+        if error:
+            letters_html = f"{LETTER_ERROR_SPAN}{escape(word)}{SPAN_END}"
+        else:
+            letters_html = (
+                f"{LETTER_CORRECT_SPAN}{escape(word[:typed_length])}{SPAN_END}"
+                f"{LETTER_DEFAULT_SPAN}{escape(word[typed_length:])}{SPAN_END}"
+            )
+        if letters_html != self._letters_html and self.letter_label is not None:
+            self._letters_html = letters_html
+            self.letter_label.setText(letters_html)
 
     def _play_pronunciation(self, delay_ms: int = 0) -> None:
         if delay_ms <= 0:
             self._speak_current_word()
-        else:
-            QTimer.singleShot(delay_ms, self._speak_current_word)
+        elif not self._speak_timer.isActive():
+            # A delayed replay already queued will speak the current word anyway.
+            self._speak_timer.start(delay_ms)
 
     def _handle_input_error(self, typed_length: int) -> None:
         self.stats.register_error(max(typed_length, 0))
@@ -226,52 +283,46 @@ class WordPracticeWidget(QWidget):
             self.entry.clear()
             self.entry.blockSignals(False)
             self.entry.setFocus()
-        for reset_label in self.letter_labels:
-            reset_label.setStyleSheet("color: #dc2626; padding: 6px 8px;")
-        self._play_pronunciation(delay_ms=600)
-        QTimer.singleShot(800, self._render_current_word)
+        self._show_letters(0, error=True)
+        # During an error burst keep one replay and one re-render in flight.
+        if not self._error_timer.isActive():
+            self._play_pronunciation(delay_ms=600)
+            self._error_timer.start(800)
         self._update_status()
 
     def _speak_current_word(self) -> None:
         if self.current_word is None:
             return
-        utterance = self.current_word.word.lower()
-        self.tts.speak(utterance)
+        # Words left behind by fast typing or error replays are stale; say the current one next.
+        self.tts.speak(self._target_lc, replace_pending=True)
 
     def _on_input_change(self, text: str) -> None:
         if self.current_word is None:
             return
-        lowercase_target = self.current_word.word.lower()
+        lowercase_target = self._target_lc
 
         if not text:
-            for label in self.letter_labels:
-                label.setStyleSheet("color: #1e293b; padding: 6px 8px;")
+            self._show_letters(0)
             return
 
         normalized_text = text.lower()
 
-        if len(normalized_text) > len(lowercase_target):
+        # One C-level check covers both a wrong letter and typing past the word.
+        if not lowercase_target.startswith(normalized_text):
             self._handle_input_error(len(text))
             return
 
-        for idx, label in enumerate(self.letter_labels):
-            if idx < len(normalized_text):
-                if normalized_text[idx] == lowercase_target[idx]:
-                    label.setStyleSheet("color: #16a34a; padding: 6px 8px;")
-                else:
-                    self._handle_input_error(len(text))
-                    return
-            else:
-                label.setStyleSheet("color: #1e293b; padding: 6px 8px;")
+        self._show_letters(len(normalized_text))
 
         if normalized_text == lowercase_target:
             self.stats.register_word(len(lowercase_target))
             self._update_status()
-            QTimer.singleShot(350, self._next_word)
+            self._next_word_timer.start(350)
 
     def _update_status(self) -> None:
         if self.status_label is None:
             return
-        self.status_label.setText(
-            f"速度: {self.stats.words_per_minute:.1f} 词/分钟 | 正确率: {self.stats.accuracy * 100:.1f}%"
-        )
+        text = f"速度: {self.stats.words_per_minute:.1f} 词/分钟 | 正确率: {self.stats.accuracy * 100:.1f}%"
+        if text != self._last_status_text:
+            self._last_status_text = text
+            self.status_label.setText(text)
@@ -0,0 +1,36 @@
+import socket
+import time
+import unittest
+
+from app.network.codec import decode, encode
+from app.network.pk_server import PkServer
+
+
+class PkServerMalformedTypeTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.server = PkServer(host="127.0.0.1", port=0)
+        self.addr = self.server.sock.getsockname()
+        self.server.start()
+        self.client = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.client.settimeout(2)
+
+    def tearDown(self) -> None:
+        self.client.close()
+        self.server.stop()
+        self.server.join(timeout=1)
+
+    def test_unhashable_type_is_ignored(self) -> None:
+        for raw in (b'{"type": ["x"]}', b'{"type": {"a": 1}}', b'{"type": 1}'):
+            self.client.sendto(raw, self.addr)
+        time.sleep(0.2)
+        self.assertTrue(self.server.is_alive())
+
+        self.client.sendto(encode({"type": "register", "student_id": "11111111", "name": "张三"}), self.addr)
+        data, _ = self.client.recvfrom(16384)
+        message = decode(data)
+        self.assertEqual(message["type"], "user_list")
+        self.assertEqual([user["student_id"] for user in message["users"]], ["11111111"])
+
+
+if __name__ == "__main__":
+    unittest.main()